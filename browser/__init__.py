@@ -8,7 +8,7 @@ or a direct Chrome DevTools Protocol (CDP) connection.
 
 Public API
 ----------
-    from browser import BrowserSession, CDPSession, ChromeProcess
+    from browser import BrowserSession, CDPSession, ChromeProcess, shutdown_browsers
 
 Quick-start (simple scrape)
 ---------------------------
@@ -34,6 +34,10 @@ Quick-start (AI-assisted)
         )
         print(answer)
 
+Playwright sessions share one driver and browser process.  They are stopped
+automatically once idle (and when asyncio.run() finishes); long-running apps
+can release them immediately on exit with `await shutdown_browsers()`.
+
 Backend selection
 -----------------
     BrowserSession(use_playwright=True)   # uses Playwright if installed (default)
@@ -50,11 +54,12 @@ Optional dependency additions for requirements.txt:
     websockets>=12.0
 """
 
-from .browser import BrowserSession
+from .browser import BrowserSession, shutdown_browsers
 from .cdp     import CDPSession, ChromeProcess
 
 __all__ = [
     "BrowserSession",
     "CDPSession",
     "ChromeProcess",
+    "shutdown_browsers",
 ]
@@ -41,6 +41,8 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import importlib.util
+import json
 import logging
 import os
 import re
@@ -51,18 +53,179 @@ from .cdp import CDPSession, ChromeProcess
 
 logger = logging.getLogger("ruby.browser")
 
+_FENCE_OPEN_RE  = re.compile(r"^```[a-z]*\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?```$")
+
 # ---------------------------------------------------------------------------
 # Playwright availability check
 # ---------------------------------------------------------------------------
 
 def _playwright_available() -> bool:
     try:
-        import importlib
         return importlib.util.find_spec("playwright") is not None
     except Exception:
         return False
 
 
+# Resource types aborted when BrowserSession(block_resources=True).
+# Stylesheets are kept so layout-dependent selectors and screenshots still work.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _abort_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# ---------------------------------------------------------------------------
+# Shared Playwright browser
+# ---------------------------------------------------------------------------
+#
+# Launching Chromium costs hundreds of ms to seconds, whereas a new
+# BrowserContext is cheap and fully isolated (cookies, storage, cache).
+# Sessions therefore share one browser per (headless, executable) pair and
+# each opens its own context.  Playwright objects are bound to the event loop
+# that created them, so the cache starts over if the running loop changes.
+#
+# Once the last session closes, an idle task stops the browsers and driver
+# after _PW_IDLE_TIMEOUT seconds unless another session starts in the
+# meantime, so back-to-back tasks stay warm but nothing outlives the work.
+# asyncio.run() cancels pending tasks before closing its loop, which runs the
+# same shutdown immediately — a script's `async with BrowserSession()` still
+# leaves no Chromium behind.
+
+_PW_IDLE_TIMEOUT = 60.0
+
+_pw_lock:     Optional[asyncio.Lock]              = None
+_pw_loop:     Optional[asyncio.AbstractEventLoop] = None
+_pw_driver:   Any                                 = None
+_pw_browsers: dict[tuple[bool, str], Any]         = {}
+_pw_active:   int                                 = 0      # open Playwright sessions
+_pw_idle:     Optional[asyncio.Task]              = None
+
+
+def _bind_loop() -> None:
+    """Reset the shared state if it belongs to a different event loop."""
+    global _pw_lock, _pw_loop, _pw_driver, _pw_active, _pw_idle
+    loop = asyncio.get_running_loop()
+    if loop is not _pw_loop:
+        if _pw_driver is not None:
+            # Only reachable if the old loop died with sessions still open;
+            # its handles can't be closed from another loop.
+            logger.warning("[Browser] Event loop changed; abandoning previous Playwright driver.")
+        _pw_loop, _pw_lock, _pw_driver = loop, asyncio.Lock(), None
+        _pw_active, _pw_idle = 0, None
+        _pw_browsers.clear()
+
+
+def _acquire_shared() -> None:
+    """Register an open session and cancel any pending idle shutdown."""
+    global _pw_active, _pw_idle
+    _bind_loop()
+    _pw_active += 1
+    if _pw_idle is not None:
+        _pw_idle.cancel()
+        _pw_idle = None
+
+
+def _release_shared() -> None:
+    """Unregister a session; schedule shutdown once none are left."""
+    global _pw_active, _pw_idle
+    if _pw_loop is not asyncio.get_running_loop():
+        return
+    _pw_active = max(_pw_active - 1, 0)
+    if _pw_active == 0 and _pw_idle is None:
+        _pw_idle = _pw_loop.create_task(_idle_shutdown())
+
+
+async def _idle_shutdown() -> None:
+    """Wait out the idle window, then shut down if still unused."""
+    global _pw_idle
+    try:
+        await asyncio.sleep(_PW_IDLE_TIMEOUT)
+    finally:
+        # Also runs when cancelled: by a new session (which makes this a
+        # no-op) or by asyncio.run() tearing down the loop.
+        if _pw_idle is asyncio.current_task():
+            _pw_idle = None
+        await _shutdown_if_idle()
+
+
+async def _shutdown_if_idle() -> None:
+    if _pw_lock is None:
+        return
+    async with _pw_lock:
+        # Re-checked under the lock: a session may have started since the
+        # idle task was scheduled, and must not lose its browser.
+        if _pw_active == 0:
+            await _close_shared_locked()
+
+
+async def _shared_driver():
+    """Return the running Playwright driver, starting it on first use."""
+    global _pw_driver
+    _bind_loop()
+    async with _pw_lock:
+        if _pw_driver is None:
+            from playwright.async_api import async_playwright  # type: ignore
+            _pw_driver = await async_playwright().start()
+        return _pw_driver
+
+
+async def _shared_browser(headless: bool, executable: str = ""):
+    """Return a connected Playwright Browser, launching it on first use."""
+    driver = await _shared_driver()
+    async with _pw_lock:
+        key = (headless, executable)
+        browser = _pw_browsers.get(key)
+        if browser is not None and browser.is_connected():
+            return browser
+        launch_args = {"headless": headless}
+        if executable:
+            launch_args["executable_path"] = executable
+        browser = await driver.chromium.launch(**launch_args)
+        _pw_browsers[key] = browser
+        logger.info("[Browser] Playwright Chromium launched.")
+        return browser
+
+
+async def shutdown_browsers() -> None:
+    """
+    Close every shared Playwright browser and stop the driver process.
+
+    Idle browsers are stopped automatically; call this on application
+    shutdown to release them immediately.  A later BrowserSession simply
+    starts them again.
+    """
+    global _pw_idle
+    if _pw_lock is None or _pw_loop is not asyncio.get_running_loop():
+        return
+    idle, _pw_idle = _pw_idle, None
+    if idle is not None and idle is not asyncio.current_task():
+        idle.cancel()
+    async with _pw_lock:
+        await _close_shared_locked()
+
+
+async def _close_shared_locked() -> None:
+    """Close all shared browsers and the driver.  Caller holds _pw_lock."""
+    global _pw_driver
+    if _pw_driver is None and not _pw_browsers:
+        return
+    for browser in list(_pw_browsers.values()):
+        try:
+            await browser.close()
+        except Exception as exc:
+            logger.debug("[Browser] Error closing shared browser: %s", exc)
+    _pw_browsers.clear()
+    if _pw_driver is not None:
+        await _pw_driver.stop()
+        _pw_driver = None
+    logger.info("[Browser] Playwright stopped.")
+
+
 # ---------------------------------------------------------------------------
 # BrowserSession
 # ---------------------------------------------------------------------------
@@ -77,9 +240,13 @@ class BrowserSession:
     headless       : bool   — launch without a visible window (default: False)
     port           : int    — CDP debugging port (default: 9222)
     executable     : str    — path to Chromium/Chrome binary (auto-detected)
-    user_data_dir  : str    — profile directory (auto: tmp/ruby_chrome_profile)
+    user_data_dir  : str    — profile directory (auto: tmp/ruby_chrome_profile);
+                              with Playwright, set it to keep cookies/cache
+                              across sessions in a persistent context
     use_playwright : bool   — prefer Playwright if installed (default: True)
     vault          : Vault  — for cookie persistence (optional)
+    block_resources: bool   — skip images, media and fonts for faster
+                              text-only browsing (Playwright only, default: False)
     """
 
     def __init__(
@@ -90,20 +257,22 @@ class BrowserSession:
         user_data_dir: str = "",
         use_playwright: bool = True,
         vault=None,
+        block_resources: bool = False,
     ):
         self.headless    = headless
         self.port        = port
         self.executable  = executable
         self.user_data_dir = user_data_dir
         self._vault      = vault
+        self.block_resources = block_resources
 
         self._use_pw = use_playwright and _playwright_available()
 
-        # Playwright handles
-        self._pw              = None
+        # Playwright handles (the browser itself is shared, see _shared_browser)
         self._pw_browser      = None
         self._pw_context      = None
         self._pw_page         = None
+        self._pw_acquired     = False
 
         # CDP handles
         self._chrome: Optional[ChromeProcess] = None
@@ -137,21 +306,46 @@ class BrowserSession:
             await self._close_cdp()
 
     async def _launch_playwright(self) -> None:
-        from playwright.async_api import async_playwright  # type: ignore
-        self._pw = await async_playwright().__aenter__()
-        launch_args = {"headless": self.headless}
-        if self.executable:
-            launch_args["executable_path"] = self.executable
-        self._pw_browser = await self._pw.chromium.launch(**launch_args)
-        self._pw_context = await self._pw_browser.new_context()
-        self._pw_page    = await self._pw_context.new_page()
-        logger.info("[Browser] Playwright Chromium launched.")
+        _acquire_shared()
+        self._pw_acquired = True
+        try:
+            await self._open_playwright_page()
+        except BaseException:
+            await self._close_playwright()
+            raise
+        logger.debug("[Browser] Playwright context opened.")
+
+    async def _open_playwright_page(self) -> None:
+        if self.user_data_dir:
+            # A persistent context owns its own browser process; it reuses the
+            # profile's cookies, storage and HTTP cache from earlier runs.
+            launch_args = {"headless": self.headless}
+            if self.executable:
+                launch_args["executable_path"] = self.executable
+            driver = await _shared_driver()
+            self._pw_context = await driver.chromium.launch_persistent_context(
+                self.user_data_dir, **launch_args
+            )
+        else:
+            self._pw_browser = await _shared_browser(self.headless, self.executable)
+            self._pw_context = await self._pw_browser.new_context()
+        if self.block_resources:
+            await self._pw_context.route("**/*", _abort_heavy_resources)
+        pages = self._pw_context.pages
+        self._pw_page    = pages[0] if pages else await self._pw_context.new_page()
 
     async def _close_playwright(self) -> None:
-        if self._pw_browser:
-            await self._pw_browser.close()
-        if self._pw:
-            await self._pw.__aexit__(None, None, None)
+        # The shared browser stays warm until idle; a persistent context shuts
+        # down its own browser process when closed.
+        try:
+            if self._pw_context:
+                await self._pw_context.close()
+        finally:
+            self._pw_context = None
+            self._pw_page    = None
+            if self._pw_acquired:
+                self._pw_acquired = False
+                _release_shared()
 
     async def _launch_cdp(self) -> None:
         self._chrome = ChromeProcess(
@@ -316,13 +510,16 @@ class BrowserSession:
     # Page content → clean Markdown (for AI context)
     # ------------------------------------------------------------------
 
-    async def get_markdown(self) -> str:
+    async def get_markdown(self, max_chars: int = 0) -> str:
         """
         Extract visible page text and structure it as Markdown.
         Much cheaper to feed to an LLM than raw HTML.
+
+        Blank-line collapsing and the optional *max_chars* cap are applied
+        in the page, so only the text actually needed crosses the wire.
         """
         js = """
-        (function extractText() {
+        (function extractText(limit) {
             const skip = new Set(['SCRIPT','STYLE','NOSCRIPT','META','LINK','HEAD']);
             function walk(node) {
                 if (skip.has(node.nodeName)) return '';
@@ -345,13 +542,12 @@ class BrowserSession:
                 if (tag === 'P' || tag === 'DIV') return children + '\\n';
                 return children;
             }
-            return walk(document.body);
-        })()
-        """
-        raw = await self.evaluate(js)
-        # Collapse excessive blank lines
-        cleaned = re.sub(r"\n{3,}", "\n\n", str(raw)).strip()
-        return cleaned
+            // Collapse excessive blank lines
+            const md = walk(document.body).replace(/\\n{3,}/g, '\\n\\n').trim();
+            return limit > 0 ? md.slice(0, limit) : md;
+        })(%d)
+        """ % max(int(max_chars), 0)
+        return str(await self.evaluate(js))
 
     # ------------------------------------------------------------------
     # Fill a form from a dict {selector: value}
@@ -399,7 +595,7 @@ class BrowserSession:
         if router is None:
             raise ValueError("instruct() requires a ModelRouter instance.")
 
-        md   = await self.get_markdown() if include_markdown else ""
+        md   = await self.get_markdown(max_chars=8000) if include_markdown else ""
         ss   = await self.screenshot_b64() if include_screenshot else ""
         url  = await self.current_url()
         ttl  = await self.title()
@@ -407,7 +603,7 @@ class BrowserSession:
         system_context = (
             f"You are Ruby, an AI life partner with browser automation capabilities.\n"
             f"Current page: {ttl} ({url})\n\n"
-            f"Page content (Markdown):\n{md[:8000]}\n\n"
+            f"Page content (Markdown):\n{md}\n\n"
             "If you need to interact with the page, respond ONLY with a JSON action object "
             "(no markdown fences). Valid actions:\n"
             '  {"action":"click","selector":"CSS_SELECTOR"}\n'
@@ -451,11 +647,11 @@ class BrowserSession:
                 await asyncio.sleep(0.5)
 
             # Re-capture page state for next iteration
-            md = await self.get_markdown() if include_markdown else ""
+            md = await self.get_markdown(max_chars=8000) if include_markdown else ""
             url = await self.current_url()
             ttl = await self.title()
             prompt = (
-                f"Page now: {ttl} ({url})\nContent:\n{md[:8000]}\n\n"
+                f"Page now: {ttl} ({url})\nContent:\n{md}\n\n"
                 f"Original instruction: {instruction}\nContinue or say done."
             )
 
@@ -468,11 +664,10 @@ class BrowserSession:
 
 def _try_parse_action(text: str) -> dict | None:
     """Try to parse the model response as a JSON action dict."""
-    import json
     text = text.strip()
     # Strip markdown code fences if present
-    text = re.sub(r"^```[a-z]*\n?", "", text)
-    text = re.sub(r"\n?```$", "", text)
+    text = _FENCE_OPEN_RE.sub("", text)
+    text = _FENCE_CLOSE_RE.sub("", text)
     text = text.strip()
     if not text.startswith("{"):
         return None
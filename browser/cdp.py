@@ -26,6 +26,7 @@ Features
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -36,14 +37,31 @@ from typing import Any, Callable, Coroutine
 
 logger = logging.getLogger("ruby.browser.cdp")
 
+# Compact encoder for outgoing CDP messages: orjson when installed, otherwise
+# stdlib json without the default ", " / ": " padding.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 _CDPCallback = Callable[[dict], Coroutine]
 
 # ---------------------------------------------------------------------------
 # Default Chromium locations
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
 def _find_chromium() -> str:
-    """Return the first Chromium / Chrome executable found on this system."""
+    """
+    Return the first Chromium / Chrome executable found on this system.
+
+    The result is cached for the life of the process; a failed probe raises
+    and is not cached, so installing Chrome later is still picked up.
+    """
     candidates_win = [
         r"C:\Program Files\Google\Chrome\Application\chrome.exe",
         r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
@@ -232,7 +250,7 @@ class CDPSession:
     async def send(self, method: str, params: dict | None = None) -> Any:
         self._id += 1
         msg_id = self._id
-        payload = json.dumps({"id": msg_id, "method": method, "params": params or {}})
+        payload = _dumps({"id": msg_id, "method": method, "params": params or {}})
         fut: asyncio.Future = asyncio.get_event_loop().create_future()
         self._pending[msg_id] = fut
 
@@ -21,6 +21,8 @@ Quick start
     import asyncio
     from models.router   import ModelRouter
     from channels.manager import ChannelManager
+    from browser import shutdown_browsers
+    from skills  import shutdown_skills
 
     router = ModelRouter()
     router.authenticate_all()
@@ -29,6 +31,11 @@ Quick start
     manager.add_channel("telegram", {"mode": "polling"})   # no public URL needed
     manager.add_channel("discord",  {})
 
+    # Optional: release browsers, skill clients and provider connections on exit
+    manager.add_shutdown_hook(shutdown_browsers)
+    manager.add_shutdown_hook(shutdown_skills)
+    manager.add_shutdown_hook(router.close)
+
     asyncio.run(manager.run())
 
 Per-channel setup instructions are in each adapter's module docstring.
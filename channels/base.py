@@ -127,6 +127,10 @@ class ChannelAdapter(ABC):
     They call self._dispatch(msg) whenever an inbound message arrives.
     """
 
+    # Request timeout (seconds) of the shared HTTP client; subclasses whose
+    # API calls block longer (e.g. long-polling) override it.
+    _http_timeout: float = 30.0
+
     def __init__(
         self,
         config: dict,
@@ -149,6 +153,7 @@ class ChannelAdapter(ABC):
         self._on_message: Optional[OnMessageCallback] = on_message
         self._connected = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http = None   # shared httpx.AsyncClient, see _http_client()
 
     # ------------------------------------------------------------------
     # Abstract interface
@@ -213,6 +218,24 @@ class ChannelAdapter(ABC):
         except Exception as exc:
             logger.exception("[%s] on_message handler raised: %s", self.kind.value, exc)
 
+    def _http_client(self):
+        """
+        Return this adapter's keep-alive httpx.AsyncClient, creating it on first use.
+
+        Reusing one client keeps TCP/TLS connections to the channel API warm
+        across sends instead of handshaking per request.
+        """
+        if self._http is None or self._http.is_closed:
+            import httpx
+            self._http = httpx.AsyncClient(timeout=self._http_timeout)
+        return self._http
+
+    async def _close_http_client(self) -> None:
+        """Close the shared HTTP client, if one was created."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     @property
     def is_connected(self) -> bool:
         return self._connected
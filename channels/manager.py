@@ -16,6 +16,8 @@ Usage
     import asyncio
     from models.router  import ModelRouter
     from channels.manager import ChannelManager
+    from browser import shutdown_browsers
+    from skills  import shutdown_skills
 
     router  = ModelRouter()
     router.authenticate_all()
@@ -31,14 +33,20 @@ Usage
     manager.add_channel("teams",     {"webhook_port": 3978})
     manager.add_channel("sms",       {})
 
+    # Release other subsystems' resources once the channels are down
+    manager.add_shutdown_hook(shutdown_browsers)
+    manager.add_shutdown_hook(shutdown_skills)
+    manager.add_shutdown_hook(router.close)
+
     asyncio.run(manager.run())
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from .base import ChannelAdapter, ChannelKind, InboundMessage, OutboundMessage
 
@@ -97,6 +105,7 @@ class ChannelManager:
         self._vault    = vault or self._default_vault()
         self._identity = identity
         self._adapters: list[ChannelAdapter] = []
+        self._shutdown_hooks: list[Callable[[], Any]] = []
 
         if system_prompt:
             self._router.set_system_prompt(system_prompt)
@@ -135,6 +144,15 @@ class ChannelManager:
         adapter.set_on_message(self._handle_message)
         self._adapters.append(adapter)
 
+    def add_shutdown_hook(self, hook: Callable[[], Any]) -> None:
+        """
+        Register a callable (sync or async) to run after all channels disconnect.
+
+        Hooks run in registration order; a failing hook is logged and does
+        not stop the ones after it.
+        """
+        self._shutdown_hooks.append(hook)
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -173,6 +191,15 @@ class ChannelManager:
         await asyncio.gather(*tasks, return_exceptions=True)
         logger.info("[Manager] All channels disconnected.")
 
+        for hook in self._shutdown_hooks:
+            try:
+                result = hook()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                name = getattr(hook, "__qualname__", repr(hook))
+                logger.warning("[Manager] Shutdown hook %s failed: %s", name, exc)
+
     # ------------------------------------------------------------------
     # Message handler — the core routing logic
     # ------------------------------------------------------------------
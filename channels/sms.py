@@ -46,8 +46,6 @@ try:
 except ImportError:
     raise ImportError("aiohttp required: pip install aiohttp")
 
-import httpx
-
 from .base import (
     ChannelAdapter,
     ChannelKind,
@@ -122,6 +120,7 @@ class SMSAdapter(ChannelAdapter):
     async def disconnect(self) -> None:
         if self._runner:
             await self._runner.cleanup()
+        await self._close_http_client()
         self._connected = False
         logger.info("[SMS] Disconnected.")
 
@@ -129,19 +128,18 @@ class SMSAdapter(ChannelAdapter):
         text = message.text[:SMS_MAX_LENGTH]
         url  = f"{TWILIO_API}/Accounts/{self._account_sid}/Messages.json"
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                url,
-                auth=(self._account_sid, self._auth_token),
-                data={
-                    "From": self._from_number,
-                    "To":   message.chat_id,
-                    "Body": text,
-                },
-            )
-            resp.raise_for_status()
-            result = resp.json()
-            logger.debug("[SMS] Sent SID=%s to %s", result.get("sid"), message.chat_id)
+        resp = await self._http_client().post(
+            url,
+            auth=(self._account_sid, self._auth_token),
+            data={
+                "From": self._from_number,
+                "To":   message.chat_id,
+                "Body": text,
+            },
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        logger.debug("[SMS] Sent SID=%s to %s", result.get("sid"), message.chat_id)
 
     # ------------------------------------------------------------------
     # Webhook handler
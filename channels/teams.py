@@ -32,16 +32,21 @@ Dependencies
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import json
 import logging
 from typing import Optional
 
 try:
     from aiohttp import web
-    import httpx
 except ImportError:
     raise ImportError("aiohttp and httpx required: pip install aiohttp httpx")
 
+# httpx is imported lazily by ChannelAdapter._http_client; fail at import
+# time, as before, if it is missing.
+if importlib.util.find_spec("httpx") is None:
+    raise ImportError("aiohttp and httpx required: pip install aiohttp httpx")
+
 from .base import (
     Attachment,
     ChannelAdapter,
@@ -116,6 +121,7 @@ class TeamsAdapter(ChannelAdapter):
     async def disconnect(self) -> None:
         if self._runner:
             await self._runner.cleanup()
+        await self._close_http_client()
         self._connected = False
         logger.info("[Teams] Disconnected.")
 
@@ -140,13 +146,12 @@ class TeamsAdapter(ChannelAdapter):
             activity["replyToId"] = message.reply_to
 
         token = await self._get_token()
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                url,
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-                json=activity,
-            )
-            resp.raise_for_status()
+        resp = await self._http_client().post(
+            url,
+            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+            json=activity,
+        )
+        resp.raise_for_status()
 
     # ------------------------------------------------------------------
     # Webhook handler
@@ -236,10 +241,9 @@ class TeamsAdapter(ChannelAdapter):
             "client_secret": self._app_password,
             "scope":         "https://api.botframework.com/.default",
         }
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(LOGIN_URL, data=data)
-            resp.raise_for_status()
-            token_data = resp.json()
-            self._access_token = token_data["access_token"]
-            self._token_expiry = time.time() + token_data.get("expires_in", 3600)
+        resp = await self._http_client().post(LOGIN_URL, data=data)
+        resp.raise_for_status()
+        token_data = resp.json()
+        self._access_token = token_data["access_token"]
+        self._token_expiry = time.time() + token_data.get("expires_in", 3600)
         logger.debug("[Teams] Access token refreshed.")
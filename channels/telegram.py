@@ -32,8 +32,6 @@ try:
 except ImportError:
     raise ImportError("aiohttp required: pip install aiohttp")
 
-import httpx
-
 from .base import (
     Attachment,
     ChannelAdapter,
@@ -58,6 +56,7 @@ class TelegramAdapter(ChannelAdapter):
     """
 
     kind = ChannelKind.TELEGRAM
+    _http_timeout = 35.0   # must outlast getUpdates' 30 s long-poll
 
     def __init__(self, config: dict, vault=None, on_message=None):
         super().__init__(config, vault, on_message)
@@ -102,6 +101,7 @@ class TelegramAdapter(ChannelAdapter):
             self._poll_task.cancel()
         if self._runner:
             await self._runner.cleanup()
+        await self._close_http_client()
         self._connected = False
         logger.info("[Telegram] Disconnected.")
 
@@ -264,10 +264,9 @@ class TelegramAdapter(ChannelAdapter):
 
     async def _api(self, method: str, params: Optional[dict] = None) -> dict:
         url = f"{self._base_url}/{method}"
-        async with httpx.AsyncClient(timeout=35) as client:
-            resp = await client.post(url, json=params or {})
-            resp.raise_for_status()
-            data = resp.json()
-            if not data.get("ok"):
-                raise RuntimeError(f"Telegram API error: {data.get('description')}")
-            return data.get("result", {})
+        resp = await self._http_client().post(url, json=params or {})
+        resp.raise_for_status()
+        data = resp.json()
+        if not data.get("ok"):
+            raise RuntimeError(f"Telegram API error: {data.get('description')}")
+        return data.get("result", {})
@@ -43,8 +43,6 @@ try:
 except ImportError:
     raise ImportError("aiohttp required for WhatsApp: pip install aiohttp")
 
-import httpx
-
 from .base import (
     Attachment,
     ChannelAdapter,
@@ -111,6 +109,7 @@ class WhatsAppAdapter(ChannelAdapter):
     async def disconnect(self) -> None:
         if self._runner:
             await self._runner.cleanup()
+        await self._close_http_client()
         self._connected = False
         logger.info("[WhatsApp] Disconnected.")
 
@@ -124,16 +123,15 @@ class WhatsAppAdapter(ChannelAdapter):
         if message.reply_to:
             payload["context"] = {"message_id": message.reply_to}
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{GRAPH_API}/{self._phone_id}/messages",
-                headers={
-                    "Authorization": f"Bearer {self._token}",
-                    "Content-Type":  "application/json",
-                },
-                json=payload,
-            )
-            resp.raise_for_status()
+        resp = await self._http_client().post(
+            f"{GRAPH_API}/{self._phone_id}/messages",
+            headers={
+                "Authorization": f"Bearer {self._token}",
+                "Content-Type":  "application/json",
+            },
+            json=payload,
+        )
+        resp.raise_for_status()
 
     async def send_typing(self, chat_id: str) -> None:
         """WhatsApp supports read receipts but not a persistent typing indicator via Cloud API."""
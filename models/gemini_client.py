@@ -122,6 +122,7 @@ class GeminiClient:
         self._model  = self._resolve_model(model)
         self._vault  = vault or self._default_vault()
         self._access_token: Optional[str] = None
+        self._http:         Optional[httpx.Client] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -164,26 +165,25 @@ class GeminiClient:
         payload  = self._build_payload(messages, temperature, max_tokens)
 
         url = f"{GEMINI_API_BASE}/models/{resolved}:streamGenerateContent?alt=sse"
-        with httpx.Client(timeout=120) as client:
-            with client.stream(
-                "POST",
-                url,
-                headers=self._auth_headers(),
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-                for line in response.iter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        if data.strip() == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            text = self._extract_text(chunk)
-                            if text:
-                                yield text
-                        except (json.JSONDecodeError, KeyError):
-                            continue
+        with self._client().stream(
+            "POST",
+            url,
+            headers=self._auth_headers(),
+            json=payload,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
+                    if data.strip() == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                        text = self._extract_text(chunk)
+                        if text:
+                            yield text
+                    except (json.JSONDecodeError, KeyError):
+                        continue
 
     def set_model(self, model: str) -> None:
         """Switch the active model (e.g. /model gemini-3-flash)."""
@@ -385,11 +385,23 @@ class GeminiClient:
             "Content-Type":  "application/json",
         }
 
+    def _client(self) -> httpx.Client:
+        """Keep-alive API client, reused so each request skips the TLS handshake."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.Client(timeout=120)
+        return self._http
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
     def _post(self, url: str, payload: dict) -> dict:
-        resp = httpx.post(url, headers=self._auth_headers(), json=payload, timeout=120)
+        resp = self._client().post(url, headers=self._auth_headers(), json=payload)
         if resp.status_code == 401:
             if self._refresh_from_vault():
-                resp = httpx.post(url, headers=self._auth_headers(), json=payload, timeout=120)
+                resp = self._client().post(url, headers=self._auth_headers(), json=payload)
             else:
                 raise GeminiAuthError("Access token expired and refresh failed. Run authenticate().")
         resp.raise_for_status()
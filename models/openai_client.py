@@ -99,6 +99,7 @@ class OpenAIClient:
         self._model  = model
         self._vault  = vault or self._default_vault()
         self._access_token: Optional[str] = None
+        self._http:         Optional[httpx.Client] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -152,26 +153,25 @@ class OpenAIClient:
             "max_tokens": max_tokens,
             "stream": True,
         }
-        with httpx.Client(timeout=120) as client:
-            with client.stream(
-                "POST",
-                f"{OPENAI_API_BASE}/chat/completions",
-                headers=self._auth_headers(),
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-                for line in response.iter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        if data == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            delta = chunk["choices"][0]["delta"]
-                            if "content" in delta:
-                                yield delta["content"]
-                        except (json.JSONDecodeError, KeyError):
-                            continue
+        with self._client().stream(
+            "POST",
+            f"{OPENAI_API_BASE}/chat/completions",
+            headers=self._auth_headers(),
+            json=payload,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                        delta = chunk["choices"][0]["delta"]
+                        if "content" in delta:
+                            yield delta["content"]
+                    except (json.JSONDecodeError, KeyError):
+                        continue
 
     def set_model(self, model: str) -> None:
         """Switch the active model (e.g. /model gpt-4o-mini)."""
@@ -306,21 +306,31 @@ class OpenAIClient:
             "Content-Type":  "application/json",
         }
 
+    def _client(self) -> httpx.Client:
+        """Keep-alive API client, reused so each request skips the TLS handshake."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.Client(timeout=120)
+        return self._http
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
     def _post(self, path: str, payload: dict) -> dict:
-        resp = httpx.post(
+        resp = self._client().post(
             f"{OPENAI_API_BASE}{path}",
             headers=self._auth_headers(),
             json=payload,
-            timeout=120,
         )
         if resp.status_code == 401:
             # Try refresh once
             if self._refresh_from_vault():
-                resp = httpx.post(
+                resp = self._client().post(
                     f"{OPENAI_API_BASE}{path}",
                     headers=self._auth_headers(),
                     json=payload,
-                    timeout=120,
                 )
             else:
                 raise OpenAIAuthError("Access token expired and refresh failed. Run authenticate().")
@@ -32,6 +32,7 @@ Usage:
 """
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Generator, Optional
 
@@ -94,6 +95,10 @@ class ModelRouter:
         Model to try if the primary fails. Set to None to disable fallback.
     vault : Vault | None
         Ruby vault passed to both clients.
+    max_history : int | None
+        Keep at most this many history messages (user + assistant, >= 2).
+        The oldest are dropped as new ones arrive, always leaving the history
+        starting on a user turn.  None keeps the full history.
     """
 
     def __init__(
@@ -101,7 +106,10 @@ class ModelRouter:
         primary_model:  str = DEFAULT_PRIMARY,
         fallback_model: Optional[str] = DEFAULT_FALLBACK,
         vault=None,
+        max_history: Optional[int] = None,
     ):
+        if max_history is not None and max_history < 2:
+            raise ValueError("max_history must be at least 2 (one user + assistant turn).")
         self._vault = vault or self._default_vault()
         self._primary_id  = primary_model
         self._fallback_id = fallback_model
@@ -111,8 +119,10 @@ class ModelRouter:
         self._gemini = GeminiClient(vault=self._vault)
 
         # Conversation history (maintained across turns)
-        self._history: list[dict] = []
+        self._history: deque[dict] = deque()
+        self._max_history = max_history
         self._system_prompt: Optional[str] = None
+        self._system_msg:    Optional[dict] = None   # prebuilt once per prompt change
 
         # Stats
         self._request_count  = 0
@@ -287,6 +297,7 @@ class ModelRouter:
     def set_system_prompt(self, prompt: str) -> None:
         """Set Ruby's system/persona prompt."""
         self._system_prompt = prompt
+        self._system_msg    = {"role": "system", "content": prompt} if prompt else None
 
     def clear_history(self) -> None:
         """Clear conversation history (start a fresh session)."""
@@ -295,6 +306,15 @@ class ModelRouter:
     def get_history(self) -> list[dict]:
         return list(self._history)
 
+    def close(self) -> None:
+        """
+        Release both providers' pooled HTTP connections.
+
+        Safe to call more than once; a later request simply reconnects.
+        """
+        self._openai.close()
+        self._gemini.close()
+
     # ------------------------------------------------------------------
     # Status
     # ------------------------------------------------------------------
@@ -348,9 +368,7 @@ class ModelRouter:
             return self._gemini.stream(messages, model=model_id, temperature=temperature, max_tokens=max_tokens)
 
     def _build_messages(self, user_message: str, use_history: bool) -> list[dict]:
-        messages = []
-        if self._system_prompt:
-            messages.append({"role": "system", "content": self._system_prompt})
+        messages = [self._system_msg] if self._system_msg else []
         if use_history:
             messages.extend(self._history)
         else:
@@ -359,9 +377,23 @@ class ModelRouter:
 
     def _append_user(self, text: str) -> None:
         self._history.append({"role": "user", "content": text})
+        self._trim_history()
 
     def _append_assistant(self, text: str) -> None:
         self._history.append({"role": "assistant", "content": text})
+        self._trim_history()
+
+    def _trim_history(self) -> None:
+        """Enforce max_history without leaving an assistant turn at the front."""
+        if self._max_history is None:
+            return
+        history = self._history
+        while len(history) > self._max_history:
+            history.popleft()
+        # Providers (Gemini in particular) reject contents that open with a
+        # model turn, so drop any orphaned assistant reply left at the front.
+        while history and history[0]["role"] != "user":
+            history.popleft()
 
     def _model_list(self) -> str:
         lines = ["**Available Models:**\n"]
@@ -26,10 +26,18 @@ logger = logging.getLogger("ruby.scheduling.run_job")
 async def _main(job_name: str) -> None:
     from security.vault  import Vault
     from models.router   import ModelRouter
-    from scheduling.cron import CronScheduler
 
     vault     = Vault()
     router    = ModelRouter(vault=vault)
+    try:
+        await _run(job_name, vault, router)
+    finally:
+        router.close()
+
+
+async def _run(job_name: str, vault, router) -> None:
+    from scheduling.cron import CronScheduler
+
     scheduler = CronScheduler(router=router, vault=vault)
 
     try:
@@ -11,6 +11,7 @@ Public API
         skill_tool,   # decorator
         SkillLoader,  # discover & call tools
         SkillRegistry, # community skill install/uninstall/update
+        shutdown_skills, # await on exit to release skill resources
     )
 
 Quick-start
@@ -36,7 +37,7 @@ CLI commands
 """
 
 from .base     import skill_tool, ToolMetadata, ToolParam, is_skill_tool, get_tool_meta
-from .loader   import SkillLoader, LoadedSkill
+from .loader   import SkillLoader, LoadedSkill, shutdown_skills
 from .registry import SkillRegistry, RegistryEntry, InstalledSkill
 
 __all__ = [
@@ -47,6 +48,7 @@ __all__ = [
     "get_tool_meta",
     "SkillLoader",
     "LoadedSkill",
+    "shutdown_skills",
     "SkillRegistry",
     "RegistryEntry",
     "InstalledSkill",
@@ -26,28 +26,100 @@ Usage inside a skill's __init__.py:
 
 from __future__ import annotations
 
-import functools
+import collections.abc
 import inspect
+import types
+import typing
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
+# "No default" sentinel, bound once instead of walking inspect.Parameter each time.
+_EMPTY = inspect.Parameter.empty
+
+# Python annotation → JSON-Schema type.  Keyed by both the runtime type (or the
+# origin of a subscripted generic) and its source spelling, since modules using
+# `from __future__ import annotations` expose annotations as strings.
+_PY_TO_JSON: dict[Any, str] = {
+    str:   "string",  "str":   "string",
+    int:   "integer", "int":   "integer",
+    float: "number",  "float": "number",
+    bool:  "boolean", "bool":  "boolean",
+    list:  "array",   "list":  "array",   "List":     "array",
+    tuple: "array",   "tuple": "array",   "Tuple":    "array",
+    set:   "array",   "set":   "array",   "Set":      "array",
+    collections.abc.Sequence: "array",    "Sequence": "array",
+    dict:  "object",  "dict":  "object",  "Dict":     "object",
+    collections.abc.Mapping:  "object",   "Mapping":  "object",
+}
+
+
+def _json_type(annotation: Any) -> str:
+    """
+    Map a parameter annotation to a JSON-Schema type (defaults to "string").
+
+    Optional[X], Union[X, None] and X | None map to X, for both runtime and
+    string annotations; unions of several real types fall back to "string".
+    """
+    if isinstance(annotation, str):
+        members = _str_union_members(annotation)
+        if len(members) != 1:
+            return "string"
+        # "typing.List[str]" / "collections.abc.Sequence[int]" → "List" / "Sequence"
+        base = members[0].split("[", 1)[0].strip().rsplit(".", 1)[-1]
+        return _PY_TO_JSON.get(base, "string")
+
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        members = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _json_type(members[0]) if len(members) == 1 else "string"
+    return _PY_TO_JSON.get(origin or annotation, "string")
+
+
+def _str_union_members(annotation: str) -> list[str]:
+    """Split a string annotation into its non-None union members."""
+    text = annotation.strip()
+    for prefix, sep in (("Optional[", None), ("Union[", ",")):
+        for p in (prefix, "typing." + prefix):
+            if text.startswith(p) and text.endswith("]"):
+                inner = text[len(p):-1]
+                parts = [inner] if sep is None else _split_top_level(inner, sep)
+                return [m for part in parts for m in _str_union_members(part)]
+    return [m for m in _split_top_level(text, "|") if m not in ("None", "NoneType")]
+
+
+def _split_top_level(text: str, sep: str) -> list[str]:
+    """Split *text* on *sep*, ignoring separators nested inside brackets."""
+    parts: list[str] = []
+    depth = start = 0
+    for i, ch in enumerate(text):
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return parts
+
 # ---------------------------------------------------------------------------
 # ToolParam — schema for a single parameter
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ToolParam:
     name:        str
     type:        str               # "string" | "integer" | "number" | "boolean" | "array" | "object"
     description: str = ""
     required:    bool = True
-    default:     Any  = inspect.Parameter.empty
+    default:     Any  = _EMPTY
 
     def to_json_schema(self) -> dict:
+        """Return this parameter's schema (a fresh dict; callers may mutate it)."""
         schema: dict = {"type": self.type}
         if self.description:
             schema["description"] = self.description
-        if self.default is not inspect.Parameter.empty:
+        if self.default is not _EMPTY:
             schema["default"] = self.default
         return schema
 
@@ -56,40 +128,30 @@ class ToolParam:
 # ToolMetadata — attached to decorated functions as .__tool_meta__
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     name:        str
     description: str
     parameters:  dict[str, ToolParam] = field(default_factory=dict)
     required:    list[str]            = field(default_factory=list)
     skill_name:  str                  = ""      # set by loader
+    is_async:    bool                 = False   # set by @skill_tool
 
     def to_openai_schema(self) -> dict:
         """Return an OpenAI function-calling schema dict."""
-        properties = {k: v.to_json_schema() for k, v in self.parameters.items()}
-        return {
-            "type": "function",
-            "function": {
-                "name":        self.name,
-                "description": self.description,
-                "parameters": {
-                    "type":       "object",
-                    "properties": properties,
-                    "required":   self.required,
-                },
-            },
-        }
+        return {"type": "function", "function": self.to_gemini_schema()}
 
     def to_gemini_schema(self) -> dict:
         """Return a Gemini function-declaration schema dict."""
-        properties = {k: v.to_json_schema() for k, v in self.parameters.items()}
+        # Built fresh on every call so adapters can add keys (required,
+        # additionalProperties, ...) without leaking into other requests.
         return {
             "name":        self.name,
             "description": self.description,
             "parameters": {
                 "type":       "object",
-                "properties": properties,
-                "required":   self.required,
+                "properties": {k: v.to_json_schema() for k, v in self.parameters.items()},
+                "required":   list(self.required),
             },
         }
 
@@ -115,11 +177,14 @@ def skill_tool(
         Human-readable description of what the tool does.
     parameters : dict[str, dict] | None
         Parameter schema.  Each key is a parameter name; each value is a dict
-        with keys: type, description, default (optional).
+        with keys: type, description, default (optional).  A missing "type" is
+        derived from the function annotation; if the whole dict is omitted,
+        parameters are taken from the function signature.
     required : list[str] | None
         Names of required parameters (defaults to all parameters that have no default).
 
-    The decorated function will have a .__tool_meta__ attribute of type ToolMetadata.
+    The function is returned unchanged apart from a .__tool_meta__ attribute
+    of type ToolMetadata.
     """
     def decorator(fn: Callable) -> Callable:
         tool_name = name or fn.__name__
@@ -127,21 +192,29 @@ def skill_tool(
 
         # Build ToolParam objects
         params: dict[str, ToolParam] = {}
-        raw_params = parameters or {}
         sig = inspect.signature(fn)
+        annotations = getattr(fn, "__annotations__", {})
+        if parameters is None:
+            raw_params = {
+                pname: {}
+                for pname, p in sig.parameters.items()
+                if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            }
+        else:
+            raw_params = parameters
 
         for pname, pdict in raw_params.items():
             sig_param = sig.parameters.get(pname)
             default = (
                 sig_param.default
-                if sig_param and sig_param.default is not inspect.Parameter.empty
-                else inspect.Parameter.empty
+                if sig_param and sig_param.default is not _EMPTY
+                else _EMPTY
             )
             if "default" in pdict:
                 default = pdict["default"]
             params[pname] = ToolParam(
                 name=pname,
-                type=pdict.get("type", "string"),
+                type=pdict["type"] if "type" in pdict else _json_type(annotations.get(pname)),
                 description=pdict.get("description", ""),
                 required=pname in (required or []),
                 default=default,
@@ -150,7 +223,7 @@ def skill_tool(
         # Default required: params with no default
         auto_required = [
             p for p, v in params.items()
-            if v.default is inspect.Parameter.empty
+            if v.default is _EMPTY
         ] if required is None else required
 
         meta = ToolMetadata(
@@ -158,14 +231,13 @@ def skill_tool(
             description=tool_desc,
             parameters=params,
             required=auto_required,
+            is_async=inspect.iscoroutinefunction(fn),
         )
 
-        @functools.wraps(fn)
-        def wrapper(*args, **kwargs):
-            return fn(*args, **kwargs)
-
-        wrapper.__tool_meta__ = meta  # type: ignore[attr-defined]
-        return wrapper
+        # Attach metadata to the function itself: no extra call frame, and
+        # coroutine functions stay detectable as such.
+        fn.__tool_meta__ = meta  # type: ignore[attr-defined]
+        return fn
 
     return decorator
 
@@ -176,7 +248,7 @@ def skill_tool(
 
 def is_skill_tool(fn: Any) -> bool:
     """Return True if fn has been decorated with @skill_tool."""
-    return callable(fn) and hasattr(fn, "__tool_meta__")
+    return getattr(fn, "__tool_meta__", None) is not None
 
 
 def get_tool_meta(fn: Any) -> Optional[ToolMetadata]:
@@ -7,9 +7,54 @@ Ruby built-in skill: Web Search (DuckDuckGo Instant Answer API, no key needed)
 from __future__ import annotations
 
 import asyncio
-import urllib.parse
+import logging
+
 from skills.base import skill_tool
 
+try:
+    from orjson import loads as _loads   # parses bytes directly, no str decode
+except ImportError:
+    from json import loads as _loads
+
+logger = logging.getLogger("ruby.skills.web_search")
+
+_API_URL = "https://api.duckduckgo.com/"
+
+# One keep-alive client for all searches, so repeat queries skip the TCP/TLS
+# handshake.  Connections are bound to the loop that opened them, so the
+# client is replaced (and the old one closed) if the running loop changes.
+_client      = None
+_client_loop = None
+
+
+async def _http_client():
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        await shutdown()
+        import httpx
+        _client = httpx.AsyncClient(
+            timeout=10,
+            follow_redirects=True,
+            headers={"Accept-Encoding": "gzip"},
+        )
+        _client_loop = loop
+    return _client
+
+
+async def shutdown() -> None:
+    """Close the shared HTTP client (skill shutdown hook, see skills.loader)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is None or client.is_closed:
+        return
+    try:
+        await client.aclose()
+    except Exception as exc:
+        # A client from an already-closed loop can't be closed cleanly;
+        # dropping it lets its sockets be released on collection.
+        logger.debug("[WebSearch] Error closing HTTP client: %s", exc)
+
 
 @skill_tool(
     name="search_web",
@@ -32,10 +77,7 @@ from skills.base import skill_tool
 )
 async def search_web(query: str, max_results: int = 5) -> str:
     """Search the web via DuckDuckGo and return formatted results."""
-    import httpx
-
     # DuckDuckGo Instant Answer API (no API key required)
-    url = "https://api.duckduckgo.com/"
     params = {
         "q":      query,
         "format": "json",
@@ -43,9 +85,9 @@ async def search_web(query: str, max_results: int = 5) -> str:
         "no_redirect": "1",
         "skip_disambig": "1",
     }
-    async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
-        resp = await client.get(url, params=params)
-        data = resp.json()
+    client = await _http_client()
+    resp = await client.get(_API_URL, params=params)
+    data = _loads(resp.content)
 
     lines: list[str] = []
 
@@ -28,21 +28,28 @@ Usage
 
     # Register with ModelRouter
     loader.register_with_router(router)
+
+    # On application exit, release resources held by loaded skills
+    await shutdown_skills()
+
+A skill package may define `async def shutdown() -> None` to close clients
+or other resources; shutdown_skills() awaits it for every imported skill, and
+a forced reload runs it for the module being replaced.
 """
 
 from __future__ import annotations
 
 import asyncio
-import importlib
 import importlib.util
 import inspect
 import logging
 import os
 import sys
+import types
 from pathlib import Path
 from typing import Any, Callable
 
-from .base import ToolMetadata, is_skill_tool, get_tool_meta
+from .base import ToolMetadata
 
 logger = logging.getLogger("ruby.skills.loader")
 
@@ -54,6 +61,15 @@ _SKILLS_DIR    = Path(__file__).parent
 _BUILTINS_DIR  = _SKILLS_DIR / "builtins"
 _INSTALLED_DIR = _SKILLS_DIR / "installed"
 
+# Skill packages are imported under this synthetic namespace
+# (_ruby_skills.<scan dir>.<package>) so they never shadow or collide with
+# real modules, and each one is cached independently in sys.modules.
+_NAMESPACE = "_ruby_skills"
+
+# Shutdown hooks of replaced modules scheduled on a running loop; referenced
+# here so the tasks are not garbage-collected before they finish.
+_pending_shutdowns: set[asyncio.Task] = set()
+
 
 # ---------------------------------------------------------------------------
 # Loaded skill record
@@ -67,22 +83,33 @@ class LoadedSkill:
         self.meta:   ToolMetadata = fn.__tool_meta__
         self.meta.skill_name = skill_package
         self.package = skill_package
-        self.is_async = asyncio.iscoroutinefunction(fn)
+        # Also check fn itself: an async wrapper applied on top of @skill_tool
+        # keeps the sync metadata of the function it wraps
+        self.is_async = self.meta.is_async or inspect.iscoroutinefunction(fn)
+        # Resolve sync/async dispatch once rather than on every call
+        self._call_impl = self._async_call if self.is_async else self._thread_call
+        # Metadata is fixed once loaded, so build both schemas up front
+        self._openai = self.meta.to_openai_schema()
+        self._gemini = self.meta.to_gemini_schema()
 
     @property
     def name(self) -> str:
         return self.meta.name
 
     async def call(self, **kwargs) -> Any:
-        if self.is_async:
-            return await self.fn(**kwargs)
-        return await asyncio.get_event_loop().run_in_executor(None, lambda: self.fn(**kwargs))
+        return await self._call_impl(**kwargs)
+
+    async def _async_call(self, **kwargs) -> Any:
+        return await self.fn(**kwargs)
+
+    async def _thread_call(self, **kwargs) -> Any:
+        return await asyncio.to_thread(self.fn, **kwargs)
 
     def openai_schema(self) -> dict:
-        return self.meta.to_openai_schema()
+        return self._openai
 
     def gemini_schema(self) -> dict:
-        return self.meta.to_gemini_schema()
+        return self._gemini
 
     def __repr__(self) -> str:
         return f"<LoadedSkill name={self.name!r} package={self.package!r}>"
@@ -104,24 +131,35 @@ class SkillLoader:
 
     def __init__(self, extra_paths: list[str] | None = None):
         self._tools:  dict[str, LoadedSkill] = {}   # tool_name → LoadedSkill
+        self._by_package: dict[str, set[str]] = {}  # package → tool names
         self._extra_paths = [Path(p) for p in (extra_paths or [])]
+        # Schema lists handed to the LLM every turn; rebuilt only when tools change
+        self._openai_cache: tuple[dict, ...] | None = None
+        self._gemini_cache: tuple[dict, ...] | None = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def load_all(self) -> int:
-        """Load all skills from all known locations.  Returns count of tools loaded."""
+    def load_all(self, force: bool = False) -> int:
+        """
+        Load all skills from all known locations.  Returns count of tools loaded.
+
+        Already-imported skill modules are reused unless *force* is True, in
+        which case the old module's shutdown() hook is run and the package is
+        re-executed from source.
+        """
         before = len(self._tools)
-        for directory in self._scan_dirs():
-            self._load_skill_dir(directory)
+        dirs = self._scan_dirs()
+        for directory in dirs:
+            self._load_skill_dir(directory, force=force)
         loaded = len(self._tools) - before
-        logger.info("[Skills] %d tools loaded from %d directories.", loaded, len(self._scan_dirs()))
+        logger.info("[Skills] %d tools loaded from %d directories.", loaded, len(dirs))
         return loaded
 
-    def load_package(self, package_dir: str | Path) -> list[LoadedSkill]:
+    def load_package(self, package_dir: str | Path, force: bool = False) -> list[LoadedSkill]:
         """Load a single skill package directory.  Returns list of new LoadedSkill objects."""
-        return self._load_skill_dir(Path(package_dir))
+        return self._load_skill_dir(Path(package_dir), force=force)
 
     def list_tools(self) -> list[LoadedSkill]:
         return list(self._tools.values())
@@ -137,13 +175,22 @@ class SkillLoader:
         logger.debug("[Skills] Calling %s with %s", tool_name, kwargs)
         return await skill.call(**kwargs)
 
-    def openai_schemas(self) -> list[dict]:
-        """Return OpenAI function-calling schemas for all loaded tools."""
-        return [s.openai_schema() for s in self._tools.values()]
+    def openai_schemas(self) -> tuple[dict, ...]:
+        """
+        Return OpenAI function-calling schemas for all loaded tools.
+
+        The tuple and its dicts are cached and shared — treat them as read-only;
+        use LoadedSkill.meta.to_openai_schema() for a copy that may be mutated.
+        """
+        if self._openai_cache is None:
+            self._openai_cache = tuple(s._openai for s in self._tools.values())
+        return self._openai_cache
 
-    def gemini_schemas(self) -> list[dict]:
-        """Return Gemini function-declaration schemas for all loaded tools."""
-        return [s.gemini_schema() for s in self._tools.values()]
+    def gemini_schemas(self) -> tuple[dict, ...]:
+        """Return Gemini function-declaration schemas for all loaded tools (cached, read-only)."""
+        if self._gemini_cache is None:
+            self._gemini_cache = tuple(s._gemini for s in self._tools.values())
+        return self._gemini_cache
 
     def register_with_router(self, router) -> None:
         """
@@ -156,20 +203,36 @@ class SkillLoader:
         if hasattr(router, "_skill_loader"):
             router._skill_loader = self
         if hasattr(router, "tools"):
-            router.tools = self.openai_schemas()
+            # The router owns (and may amend) its list, so hand it fresh dicts
+            router.tools = [s.meta.to_openai_schema() for s in self._tools.values()]
         logger.info("[Skills] Registered %d tools with router.", len(self._tools))
 
     def unload(self, tool_name: str) -> bool:
         """Remove a tool by name. Returns True if it was present."""
-        if tool_name in self._tools:
-            del self._tools[tool_name]
-            return True
-        return False
+        skill = self._tools.pop(tool_name, None)
+        if skill is None:
+            return False
+        names = self._by_package.get(skill.package)
+        if names is not None:
+            names.discard(tool_name)
+            if not names:
+                del self._by_package[skill.package]
+        self._invalidate_schemas()
+        return True
+
+    def unload_package(self, package: str) -> int:
+        """Remove every tool loaded from skill *package*.  Returns count removed."""
+        names = list(self._by_package.get(package, ()))
+        for tool_name in names:
+            self.unload(tool_name)
+        return len(names)
 
     def reload_all(self) -> int:
         """Clear and re-discover all skills."""
         self._tools.clear()
-        return self.load_all()
+        self._by_package.clear()
+        self._invalidate_schemas()
+        return self.load_all(force=True)
 
     def status(self) -> dict:
         return {
@@ -182,44 +245,74 @@ class SkillLoader:
     # Internal
     # ------------------------------------------------------------------
 
+    def _invalidate_schemas(self) -> None:
+        self._openai_cache = None
+        self._gemini_cache = None
+
     def _scan_dirs(self) -> list[Path]:
         dirs = [_BUILTINS_DIR, _INSTALLED_DIR] + self._extra_paths
         return [d for d in dirs if d.exists()]
 
-    def _load_skill_dir(self, directory: Path) -> list[LoadedSkill]:
+    def _load_skill_dir(self, directory: Path, force: bool = False) -> list[LoadedSkill]:
         """Scan *directory* for skill packages and load them."""
         new_skills: list[LoadedSkill] = []
         if not directory.is_dir():
             return new_skills
 
-        for entry in sorted(directory.iterdir()):
-            if entry.is_dir() and (entry / "__init__.py").exists():
-                new_skills.extend(self._load_package(entry))
+        # scandir's cached dirent type avoids a stat per entry; a Path is only
+        # built for directories that turn out to be packages.
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            init_py = os.path.join(entry.path, "__init__.py")
+            if os.path.isfile(init_py):
+                new_skills.extend(self._load_package(Path(entry.path), force=force, init_py=init_py))
 
         return new_skills
 
-    def _load_package(self, package_path: Path) -> list[LoadedSkill]:
+    def _load_package(
+        self, package_path: Path, force: bool = False, init_py: str | None = None,
+    ) -> list[LoadedSkill]:
         """Import a package and discover @skill_tool functions."""
-        pkg_name = f"skills.{package_path.parent.name}.{package_path.name}"
+        parent_name = f"{_NAMESPACE}.{package_path.parent.name}"
+        pkg_name = f"{parent_name}.{package_path.name}"
         skills_found: list[LoadedSkill] = []
 
         try:
-            if pkg_name in sys.modules:
-                mod = importlib.reload(sys.modules[pkg_name])
-            else:
+            mod = sys.modules.get(pkg_name)
+            if mod is not None and force:
+                # The fresh module gets new globals; release whatever the old
+                # one still holds (HTTP clients, etc.) before dropping it.
+                _shutdown_replaced(pkg_name, mod)
+            if mod is None or force:
+                # force re-executes the package from a fresh spec (importlib.reload
+                # cannot re-find specs under the synthetic namespace)
+                _ensure_namespace(_NAMESPACE)
+                _ensure_namespace(parent_name)
                 spec = importlib.util.spec_from_file_location(
                     pkg_name,
-                    str(package_path / "__init__.py"),
+                    init_py or os.path.join(package_path, "__init__.py"),
                     submodule_search_locations=[str(package_path)],
                 )
                 mod = importlib.util.module_from_spec(spec)
                 sys.modules[pkg_name] = mod
-                spec.loader.exec_module(mod)
-
-            for attr_name in dir(mod):
-                fn = getattr(mod, attr_name, None)
-                if is_skill_tool(fn):
-                    meta = get_tool_meta(fn)
+                try:
+                    spec.loader.exec_module(mod)
+                except BaseException:
+                    # Don't leave a half-initialised module behind for the
+                    # fast path to reuse; the next load retries the import.
+                    sys.modules.pop(pkg_name, None)
+                    raise
+
+            for fn in list(mod.__dict__.values()):
+                # callable() is a cheap C check that skips plain data globals
+                # before the attribute lookup
+                if not callable(fn):
+                    continue
+                meta = getattr(fn, "__tool_meta__", None)
+                if meta is not None:
                     if meta.name in self._tools:
                         logger.warning(
                             "[Skills] Duplicate tool name %r — skipping %s",
@@ -228,10 +321,71 @@ class SkillLoader:
                         continue
                     skill = LoadedSkill(fn, skill_package=package_path.name)
                     self._tools[skill.name] = skill
+                    self._by_package.setdefault(skill.package, set()).add(skill.name)
                     skills_found.append(skill)
                     logger.info("[Skills] Loaded tool %r from %s", skill.name, pkg_name)
 
         except Exception as exc:
             logger.error("[Skills] Failed to load %s: %s", package_path, exc)
 
+        if skills_found:
+            self._invalidate_schemas()
         return skills_found
+
+
+async def shutdown_skills() -> None:
+    """Await the optional shutdown() hook of every imported skill package."""
+    prefix = _NAMESPACE + "."
+    for name, mod in list(sys.modules.items()):
+        if name.startswith(prefix) and mod is not None:
+            await _run_shutdown_hook(name, mod)
+
+
+def _shutdown_hook(mod: types.ModuleType) -> Callable | None:
+    """Return *mod*'s `async def shutdown()` hook, or None if it has none."""
+    hook = getattr(mod, "shutdown", None)
+    if (
+        hook is None
+        or not asyncio.iscoroutinefunction(hook)
+        or getattr(hook, "__tool_meta__", None) is not None   # a tool, not a hook
+    ):
+        return None
+    return hook
+
+
+async def _run_shutdown_hook(name: str, mod: types.ModuleType) -> None:
+    hook = _shutdown_hook(mod)
+    if hook is None:
+        return
+    try:
+        await hook()
+    except Exception as exc:
+        logger.warning("[Skills] shutdown() of %s failed: %s", name, exc)
+
+
+def _shutdown_replaced(name: str, mod: types.ModuleType) -> None:
+    """
+    Run the shutdown() hook of a module about to be replaced by a forced reload.
+
+    Loading is synchronous, so inside a running event loop the hook is
+    scheduled as a task; otherwise it is run to completion right away.
+    """
+    if _shutdown_hook(mod) is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_run_shutdown_hook(name, mod))
+        return
+    task = loop.create_task(_run_shutdown_hook(name, mod))
+    _pending_shutdowns.add(task)
+    task.add_done_callback(_pending_shutdowns.discard)
+
+
+def _ensure_namespace(name: str) -> None:
+    """Register an empty synthetic package *name* in sys.modules if missing."""
+    if name not in sys.modules:
+        ns = types.ModuleType(name)
+        ns.__path__ = []
+        ns.__package__ = name
+        sys.modules[name] = ns
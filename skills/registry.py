@@ -44,43 +44,55 @@ import os
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass, field, asdict
+import time
+from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger("ruby.skills.registry")
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 REGISTRY_URL  = "https://raw.githubusercontent.com/ruby-ai/skill-registry/main/index.json"
 INSTALLED_DIR = Path(__file__).parent / "installed"
 MANIFEST_KEY  = "skill_manifest"
+_INDEX_TTL    = 300   # seconds a fetched registry index is reused
 
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegistryEntry:
     name:        str
     description: str
     author:      str
     git_url:     str
     version:     str = ""
-    tags:        list[str] = field(default_factory=list)
+    tags:        tuple[str, ...] = ()
 
     @classmethod
     def from_dict(cls, d: dict) -> "RegistryEntry":
+        get = d.get
         return cls(
-            name=d.get("name", ""),
-            description=d.get("description", ""),
-            author=d.get("author", ""),
-            git_url=d.get("git_url", ""),
-            version=d.get("version", ""),
-            tags=d.get("tags", []),
+            get("name", ""), get("description", ""), get("author", ""),
+            get("git_url", ""), get("version", ""), tuple(get("tags") or ()),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InstalledSkill:
     name:      str
     git_url:   str
@@ -114,6 +126,8 @@ class SkillRegistry:
         self._loader = loader
         INSTALLED_DIR.mkdir(parents=True, exist_ok=True)
         self._manifest: dict[str, InstalledSkill] = {}
+        self._index_cache: tuple[float, list[RegistryEntry]] | None = None
+        self._index_by_name: dict[str, RegistryEntry] = {}
         self._load_manifest()
 
     # ------------------------------------------------------------------
@@ -121,17 +135,29 @@ class SkillRegistry:
     # ------------------------------------------------------------------
 
     async def fetch_index(self) -> list[RegistryEntry]:
-        """Download the official registry index."""
+        """Download the official registry index (reused for _INDEX_TTL seconds)."""
+        if self._index_cache and time.monotonic() - self._index_cache[0] < _INDEX_TTL:
+            return self._index_cache[1]
         import httpx
         try:
             async with httpx.AsyncClient(timeout=15) as client:
                 resp = await client.get(REGISTRY_URL)
                 resp.raise_for_status()
-                data = resp.json()
-                return [RegistryEntry.from_dict(e) for e in data]
+                data = _loads(resp.content)   # orjson parses the raw bytes when available
         except Exception as exc:
             logger.warning("[Registry] Could not fetch index: %s", exc)
+            # Don't let find() keep serving an expired by-name map
+            self.refresh_index()
             return []
+        index = [RegistryEntry.from_dict(e) for e in data]
+        self._index_cache = (time.monotonic(), index)
+        self._index_by_name = {e.name: e for e in reversed(index)}
+        return index
+
+    def refresh_index(self) -> None:
+        """Drop the cached index so the next lookup re-downloads it."""
+        self._index_cache = None
+        self._index_by_name = {}
 
     async def search(self, query: str) -> list[RegistryEntry]:
         """Search registry by name, description, or tags."""
@@ -146,11 +172,8 @@ class SkillRegistry:
 
     async def find(self, name: str) -> Optional[RegistryEntry]:
         """Find an exact entry by skill name."""
-        index = await self.fetch_index()
-        for e in index:
-            if e.name == name:
-                return e
-        return None
+        await self.fetch_index()
+        return self._index_by_name.get(name)
 
     # ------------------------------------------------------------------
     # Install
@@ -178,10 +201,10 @@ class SkillRegistry:
         dest = INSTALLED_DIR / pkg_name
         if dest.exists():
             logger.info("[Registry] Updating existing skill: %s", pkg_name)
-            ok = self._git_pull(dest)
+            ok = await self._git_pull(dest)
         else:
             logger.info("[Registry] Installing skill %s from %s", pkg_name, git_url)
-            ok = self._git_clone(git_url, dest)
+            ok = await self._git_clone(git_url, dest)
 
         if ok:
             self._install_requirements(dest)
@@ -192,7 +215,7 @@ class SkillRegistry:
             )
             self._save_manifest()
             if self._loader:
-                self._loader.load_package(dest)
+                self._loader.load_package(dest, force=True)
             logger.info("[Registry] ✓ Installed: %s", pkg_name)
 
         return ok
@@ -206,17 +229,14 @@ class SkillRegistry:
         if not dest.exists():
             logger.warning("[Registry] Skill not installed: %s", name)
             return False
-        shutil.rmtree(dest)
+        try:
+            os.rmdir(dest)          # empty leftover from a failed install
+        except OSError:
+            shutil.rmtree(dest)
         self._manifest.pop(name, None)
         self._save_manifest()
         if self._loader:
-            # Remove all tools from this skill package
-            to_remove = [
-                skill.name for skill in self._loader.list_tools()
-                if skill.package == name
-            ]
-            for tool_name in to_remove:
-                self._loader.unload(tool_name)
+            self._loader.unload_package(name)
         logger.info("[Registry] Uninstalled: %s", name)
         return True
 
@@ -226,16 +246,17 @@ class SkillRegistry:
 
     async def update_all(self) -> dict[str, bool]:
         """Pull the latest version of every installed skill.  Returns {name: ok}."""
-        results: dict[str, bool] = {}
-        for name in list(self._manifest):
-            dest = INSTALLED_DIR / name
-            if dest.exists():
-                ok = self._git_pull(dest)
-                if ok:
-                    self._install_requirements(dest)
-                    if self._loader:
-                        self._loader.load_package(dest)
-                results[name] = ok
+        names = [name for name in self._manifest if (INSTALLED_DIR / name).exists()]
+        # Pulls are network-bound: run them concurrently
+        oks = await asyncio.gather(*(self._git_pull(INSTALLED_DIR / name) for name in names))
+        results: dict[str, bool] = dict(zip(names, oks))
+
+        # One pip process for every updated skill instead of one per skill
+        updated = [INSTALLED_DIR / name for name, ok in results.items() if ok]
+        self._install_requirements(*updated)
+        if self._loader:
+            for dest in updated:
+                self._loader.load_package(dest, force=True)
         self._save_manifest()
         return results
 
@@ -254,44 +275,56 @@ class SkillRegistry:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _git_clone(url: str, dest: Path) -> bool:
+    async def _run_git(*args: str) -> tuple[int, str]:
+        """Run git without blocking the event loop.  Returns (returncode, stderr)."""
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+        return proc.returncode, stderr.decode(errors="replace").strip()
+
+    @classmethod
+    async def _git_clone(cls, url: str, dest: Path) -> bool:
         try:
-            subprocess.run(
-                ["git", "clone", "--depth=1", url, str(dest)],
-                check=True, capture_output=True, text=True,
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            logger.error("[Registry] git clone failed: %s", e.stderr.strip())
-            return False
+            rc, err = await cls._run_git("clone", "--depth=1", url, str(dest))
         except FileNotFoundError:
             logger.error("[Registry] git not found on PATH.")
             return False
+        if rc != 0:
+            logger.error("[Registry] git clone failed: %s", err)
+            return False
+        return True
 
-    @staticmethod
-    def _git_pull(dest: Path) -> bool:
+    @classmethod
+    async def _git_pull(cls, dest: Path) -> bool:
         try:
-            subprocess.run(
-                ["git", "pull"], cwd=str(dest),
-                check=True, capture_output=True, text=True,
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            logger.error("[Registry] git pull failed: %s", e.stderr.strip())
+            rc, err = await cls._run_git("-C", str(dest), "pull")
+        except FileNotFoundError:
+            logger.error("[Registry] git not found on PATH.")
+            return False
+        if rc != 0:
+            logger.error("[Registry] git pull failed for %s: %s", dest.name, err)
             return False
+        return True
 
     @staticmethod
-    def _install_requirements(dest: Path) -> None:
-        req = dest / "requirements.txt"
-        if req.exists():
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-q", "-r", str(req)],
-                    check=True, capture_output=True,
-                )
-                logger.info("[Registry] Installed requirements for %s", dest.name)
-            except subprocess.CalledProcessError as e:
-                logger.warning("[Registry] pip install warning for %s: %s", dest.name, e)
+    def _install_requirements(*dests: Path) -> None:
+        """Install the requirements.txt of every given skill in a single pip run."""
+        reqs = [dest / "requirements.txt" for dest in dests]
+        reqs = [req for req in reqs if req.exists()]
+        if not reqs:
+            return
+        names = ", ".join(req.parent.name for req in reqs)
+        args = [sys.executable, "-m", "pip", "install", "-q",
+                "--no-input", "--disable-pip-version-check"]
+        for req in reqs:
+            args += ["-r", str(req)]
+        try:
+            subprocess.run(args, check=True, capture_output=True)
+            logger.info("[Registry] Installed requirements for %s", names)
+        except subprocess.CalledProcessError as e:
+            logger.warning("[Registry] pip install warning for %s: %s", names, e)
 
     # ------------------------------------------------------------------
     # Manifest persistence
@@ -306,8 +339,7 @@ class SkillRegistry:
         else:
             mf = INSTALLED_DIR / ".manifest.json"
             if mf.exists():
-                with open(mf) as f:
-                    data = json.load(f)
+                data = _loads(mf.read_bytes())
                 for k, v in data.items():
                     self._manifest[k] = InstalledSkill.from_dict(v)
 
@@ -317,8 +349,7 @@ class SkillRegistry:
             self._vault.set(MANIFEST_KEY, data)
         else:
             mf = INSTALLED_DIR / ".manifest.json"
-            with open(mf, "w") as f:
-                json.dump(data, f, indent=2)
+            mf.write_bytes(_dumps_indented(data))
 
 
 # ---------------------------------------------------------------------------